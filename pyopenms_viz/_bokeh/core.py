@@ -6,7 +6,7 @@ from typing import Tuple
 
 from bokeh.plotting import figure
 from bokeh.palettes import Plasma256
-from bokeh.transform import linear_cmap
+from bokeh.core.properties import field
 from bokeh.models import (
     ColumnDataSource,
     Legend,
@@ -16,10 +16,11 @@ from bokeh.models import (
     VStrip,
     GlyphRenderer,
     Label,
+    LinearColorMapper,
 )
 
 from pandas.core.frame import DataFrame
-from numpy import nan
+from numpy import array, clip, full, isfinite, nan
 
 # pyopenms_viz imports
 from .._core import (
@@ -378,18 +379,15 @@ class BOKEHScatterPlot(BOKEHPlot, ScatterPlot):
             marker_gen = MarkerShapeGenerator(engine="BOKEH")
         marker_size = kwargs.pop("marker_size", 10)
 
-        if z is not None:
-            mapper = linear_cmap(
-                field_name=z,
-                palette=Plasma256[::-1],
-                low=min(data[z]),
-                high=max(data[z]),
-            )
+        # Colors are mapped from z once in Python and stored alongside the data
+        map_colors = z is not None and "fill_color" not in kwargs
+        if map_colors:
+            low, high = data[z].min(), data[z].max()
         # Set defaults if they have not been set in kwargs
         defaults = {
             "size": marker_size,
             "line_width": 0,
-            "fill_color": mapper if z is not None else next(color_gen),
+            "fill_color": field("_fill_color") if map_colors else next(color_gen),
         }
         for k, v in defaults.items():
             if k not in kwargs.keys():
@@ -397,6 +395,8 @@ class BOKEHScatterPlot(BOKEHPlot, ScatterPlot):
         if by is None:
             kwargs["marker"] = next(marker_gen)
             source = ColumnDataSource(data)
+            if map_colors:
+                source.add(cls._map_colors(data[z], low, high), "_fill_color")
             line = fig.scatter(x=x, y=y, source=source, **kwargs)
             return fig, None
         else:
@@ -406,12 +406,37 @@ class BOKEHScatterPlot(BOKEHPlot, ScatterPlot):
                 if z is None:
                     kwargs["fill_color"] = next(color_gen)
                 source = ColumnDataSource(df)
+                if map_colors:
+                    source.add(cls._map_colors(df[z], low, high), "_fill_color")
                 line = fig.scatter(x=x, y=y, source=source, **kwargs)
                 legend_items.append((group, [line]))
             legend = Legend(items=legend_items)
 
             return fig, legend
 
+    @staticmethod
+    def _map_colors(values, low, high):
+        """
+        Map values linearly onto the reversed Plasma256 palette.
+        Missing values are gray, like the default nan_color of linear_cmap.
+
+        Args:
+            values (Series): The values to map.
+            low (float): The value mapped to the first color.
+            high (float): The value mapped to the last color.
+
+        Returns:
+            numpy.ndarray: The color of each value.
+        """
+        palette = array(Plasma256[::-1])
+        scale = len(palette) / (high - low) if high > low else 0
+        values = values.to_numpy(float)
+        finite = isfinite(values)
+        idx = clip((values[finite] - low) * scale, 0, len(palette) - 1)
+        colors = full(len(values), "gray", dtype=palette.dtype)
+        colors[finite] = palette[idx.astype(int)]
+        return colors
+
 
 class BOKEH_MSPlot(BaseMSPlot, BOKEHPlot, ABC):
 
@@ -459,22 +484,22 @@ class BOKEHChromatogramPlot(BOKEH_MSPlot, ChromatogramPlot):
             colormap=self.feature_config.colormap, n=annotation_data.shape[0]
         )
         legend_items = []
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
+        for idx, feature in enumerate(annotation_data.itertuples(index=False)):
             peak_boundary_lines = self.fig.segment(
-                x0=[feature["leftWidth"], feature["rightWidth"]],
+                x0=[feature.leftWidth, feature.rightWidth],
                 y0=[0, 0],
-                x1=[feature["leftWidth"], feature["rightWidth"]],
-                y1=[feature["apexIntensity"], feature["apexIntensity"]],
+                x1=[feature.leftWidth, feature.rightWidth],
+                y1=[feature.apexIntensity, feature.apexIntensity],
                 color=next(color_gen),
                 line_dash=self.feature_config.line_type,
                 line_width=self.feature_config.line_width,
             )
             if "name" in annotation_data.columns:
-                use_name = feature["name"]
+                use_name = feature.name
             else:
                 use_name = f"Feature {idx}"
             if "q_value" in annotation_data.columns:
-                legend_label = f"{use_name} (q-value: {feature['q_value']:.4f})"
+                legend_label = f"{use_name} (q-value: {feature.q_value:.4f})"
             else:
                 legend_label = f"{use_name}"
             legend_items.append((legend_label, [peak_boundary_lines]))
@@ -523,20 +548,56 @@ class BOKEHPeakMapPlot(BOKEH_MSPlot, PeakMapPlot):
     Class for assembling a Bokeh feature heatmap plot
     """
 
+    def _plot_binned_grid(self, x, y, z):
+        """
+        Draw the binned peaks as a single image glyph instead of one scatter marker per bin.
+
+        Args:
+            x (str): The column name for the x-axis data.
+            y (str): The column name for the y-axis data.
+            z (str): The column name for the intensity data.
+        """
+        x_edges, y_edges, grid = self._get_binned_grid(x, y, z)
+        mapper = LinearColorMapper(
+            palette=Plasma256[::-1],
+            low=self.data[z].min(),
+            high=self.data[z].max(),
+            nan_color=(0, 0, 0, 0),
+        )
+        self.fig.image(
+            image=[grid],
+            x=x_edges[0],
+            y=y_edges[0],
+            dw=x_edges[-1] - x_edges[0],
+            dh=y_edges[-1] - y_edges[0],
+            color_mapper=mapper,
+        )
+        self._update_plot_aes(self.fig)
+
     def create_main_plot(self, x, y, z, class_kwargs, other_kwargs):
 
         if not self.plot_3d:
-            scatterPlot = self.get_scatter_renderer(self.data, x, y, **class_kwargs)
+            if self._use_binned_grid(z):
+                self._plot_binned_grid(x, y, z)
+                tooltips = [
+                    (self.xlabel, "$x"),
+                    (self.ylabel, "$y"),
+                    ("intensity", "@image"),
+                ]
+            else:
+                scatterPlot = self.get_scatter_renderer(
+                    self.data, x, y, **class_kwargs
+                )
+
+                self.fig = scatterPlot.generate(z=z, **other_kwargs)
 
-            self.fig = scatterPlot.generate(z=z, **other_kwargs)
+                tooltips, _ = self._create_tooltips(
+                    {self.xlabel: x, self.ylabel: y, "intensity": z}
+                )
 
             if self.annotation_data is not None:
                 self._add_box_boundaries(self.annotation_data)
 
-            tooltips, _ = self._create_tooltips(
-                {self.xlabel: x, self.ylabel: y, "intensity": z}
-            )
-
             self._add_tooltips(self.fig, tooltips)
         else:
             raise NotImplementedError("3D PeakMap plots are not supported in Bokeh")
@@ -610,11 +671,11 @@ class BOKEHPeakMapPlot(BOKEH_MSPlot, PeakMapPlot):
             colormap=self.feature_config.colormap, n=annotation_data.shape[0]
         )
         legend_items = []
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
-            x0 = feature["leftWidth"]
-            x1 = feature["rightWidth"]
-            y0 = feature["IM_leftWidth"]
-            y1 = feature["IM_rightWidth"]
+        for idx, feature in enumerate(annotation_data.itertuples(index=False)):
+            x0 = feature.leftWidth
+            x1 = feature.rightWidth
+            y0 = feature.IM_leftWidth
+            y1 = feature.IM_rightWidth
 
             # Calculate center points and dimensions
             center_x = (x0 + x1) / 2
@@ -633,11 +694,11 @@ class BOKEHPeakMapPlot(BOKEH_MSPlot, PeakMapPlot):
                 fill_alpha=0,
             )
             if "name" in annotation_data.columns:
-                use_name = feature["name"]
+                use_name = feature.name
             else:
                 use_name = f"Feature {idx}"
             if "q_value" in annotation_data.columns:
-                legend_label = f"{use_name} (q-value: {feature['q_value']:.4f})"
+                legend_label = f"{use_name} (q-value: {feature.q_value:.4f})"
             else:
                 legend_label = f"{use_name}"
             legend_items.append((legend_label, [box_boundary_lines]))
@@ -6,13 +6,34 @@ import importlib
 import types
 import re
 
-from pandas import cut, merge, Interval
+from pandas import cut, factorize, merge, Index, Series
 from pandas.core.frame import DataFrame
 from pandas.core.dtypes.generic import ABCDataFrame
 from pandas.core.dtypes.common import is_integer
 from pandas.util._decorators import Appender
 
-from numpy import ceil, log1p, log2, nan, mean
+from numpy import (
+    arange,
+    argsort,
+    array,
+    bincount,
+    ceil,
+    clip,
+    flatnonzero,
+    float32,
+    full,
+    inf,
+    intp,
+    isfinite,
+    isnan,
+    log1p,
+    log2,
+    maximum,
+    nan,
+    searchsorted,
+    where,
+    zeros,
+)
 
 from ._config import LegendConfig, FeatureConfig, _BasePlotConfig
 from ._misc import (
@@ -20,6 +41,7 @@ from ._misc import (
     sturges_rule,
     freedman_diaconis_rule,
     mz_tolerance_binning,
+    bin2d_numba,
 )
 from .constants import IS_SPHINX_BUILD
 import warnings
@@ -29,6 +51,8 @@ _common_kinds = ("line", "vline", "scatter")
 _msdata_kinds = ("chromatogram", "mobilogram", "spectrum", "peakmap")
 _all_kinds = _common_kinds + _msdata_kinds
 _entrypoint_backends = ("ms_matplotlib", "ms_bokeh", "ms_plotly")
+# Number of peaks above which peak maps are binned with the numba kernel, if installed
+_numba_binning_threshold = 1_000_000
 
 _baseplot_doc = f"""
     Plot method for creating plots from a Pandas DataFrame.
@@ -59,6 +83,8 @@ _baseplot_doc = f"""
         Whether to show the grid on the plot.
     toolbar_location : str or None, optional
         The location of the toolbar (e.g., 'above', 'below', 'left', 'right').
+    render_mode : str or None, optional
+        How Plotly draws line and scatter traces, one of 'auto', 'svg' or 'webgl'.
     fig : figure or None, optional
         An existing figure object to plot on.
     title : str or None, optional
@@ -124,6 +150,7 @@ class BasePlot(ABC):
         width: int | None = None,
         grid: bool | None = None,
         toolbar_location: str | None = None,
+        render_mode: Literal["auto", "svg", "webgl"] | None = None,
         fig: "figure" | None = None,
         title: str | None = None,
         xlabel: str | None = None,
@@ -163,6 +190,7 @@ class BasePlot(ABC):
         self.width = width
         self.grid = grid
         self.toolbar_location = toolbar_location
+        self.render_mode = render_mode
         self.fig = fig
         self.title = title
         self.xlabel = xlabel
@@ -239,9 +267,14 @@ class BasePlot(ABC):
 
         if self.data[known_columns_without_int].duplicated().any():
             if self.aggregate_duplicates:
+                # Peak maps are re-ordered by intensity or binned afterwards, so the group order is irrelevant
                 self.data = (
                     self.data[self.known_columns]
-                    .groupby(known_columns_without_int)
+                    .groupby(
+                        known_columns_without_int,
+                        observed=True,
+                        sort=self.kind not in {"peakmap"},
+                    )
                     .sum()
                     .reset_index()
                 )
@@ -266,23 +299,25 @@ class BasePlot(ABC):
             ValueError: if colname is not numeric
         """
 
-        def holds_integer(column) -> bool:
-            return column.inferred_type in {"integer", "mixed-integer"}
+        def holds_integer(columns: Index) -> bool:
+            # Integer column labels, an integer colname is then a label not a position
+            # (inferred_type is cached on the Index)
+            return columns.inferred_type in {"integer", "mixed-integer"}
 
         if colname is None:
             raise ValueError(f"For `{self.kind}` plot, `{name}` must be set")
 
+        columns = self.data.columns
         # if integer is supplied get the corresponding column associated with that index
-        if is_integer(colname) and not holds_integer(self.data.columns):
-            if colname >= len(self.data.columns):
-                print(self.data.columns)
+        if is_integer(colname) and not holds_integer(columns):
+            if colname >= len(columns):
                 raise ValueError(
                     f"Column index `{colname}` out of range, `{name}` could not be set"
                 )
             else:
-                colname = self.data.columns[colname]
+                colname = columns[colname]
         else:  # assume column name is supplied
-            if colname not in self.data.columns:
+            if colname not in columns:
                 raise KeyError(
                     f"Column `{colname}` not in data, `{name}` could not be set"
                 )
@@ -569,7 +604,7 @@ class ChromatogramPlot(BaseMSPlot, ABC):
 
         # Convert to relative intensity if required
         if relative_intensity:
-            self.data[y] = self.data[y] / self.data[y].max() * 100
+            self.data[y] = self.data[y].to_numpy() * (100.0 / self.data[y].max())
 
         self._check_and_aggregate_duplicates()
         # sort data by x so in order
@@ -586,10 +621,11 @@ class ChromatogramPlot(BaseMSPlot, ABC):
         else:
             color_gen = kwargs["line_color"]
 
+        columns = self.data.columns
         tooltip_entries = {"retention time": x, "intensity": y}
-        if "Annotation" in self.data.columns:
+        if "Annotation" in columns:
             tooltip_entries["annotation"] = "Annotation"
-        if "product_mz" in self.data.columns:
+        if "product_mz" in columns:
             tooltip_entries["product m/z"] = "product_mz"
         TOOLTIPS, custom_hover_data = self._create_tooltips(tooltip_entries)
         kwargs.pop(
@@ -634,10 +670,6 @@ class MobilogramPlot(ChromatogramPlot, ABC):
     ) -> None:
         super().__init__(data, x, y, annotation_data=annotation_data, **kwargs)
 
-    def plot(self, data, x, y, **kwargs):
-        super().plot(data, x, y, **kwargs)
-        self._modify_y_range((0, self.data[y].max()), (0, 0.1))
-
 
 class SpectrumPlot(BaseMSPlot, ABC):
     @property
@@ -750,13 +782,14 @@ class SpectrumPlot(BaseMSPlot, ABC):
         )
         kwargs.pop("fig", None)  # remove figure from **kwargs if exists
 
+        columns = self.data.columns
         entries = {"m/z": x, "intensity": y}
         for optional in (
             "native_id",
             self.ion_annotation,
             self.sequence_annotation,
         ):
-            if optional in self.data.columns:
+            if optional in columns:
                 entries[optional.replace("_", " ")] = optional
 
         tooltips, custom_hover_data = self._create_tooltips(
@@ -829,23 +862,49 @@ class SpectrumPlot(BaseMSPlot, ABC):
         Returns:
             DataFrame: The binned data.
         """
+        # Bins are computed as a separate key so the input data is not modified
+        x_bins = data[x]
         if isinstance(self.num_x_bins, int):
-            data[x] = cut(data[x], bins=self.num_x_bins)
+            # Integer bin codes avoid building Interval labels, each value is replaced by its bin center
+            codes, edges = cut(
+                data[x], bins=self.num_x_bins, labels=False, retbins=True
+            )
+            codes = codes.to_numpy(float)
+            in_bin = ~isnan(codes)
+            centers = full(len(codes), nan)
+            centers[in_bin] = ((edges[:-1] + edges[1:]) / 2)[codes[in_bin].astype(intp)]
+            x_bins = Series(centers, index=data.index, name=x)
         elif isinstance(self.num_x_bins, list) and all(
             isinstance(item, tuple) for item in self.num_x_bins
         ):
-            # Function to assign each value to a bin
-            def assign_bin(value):
-                for low, high in self.num_x_bins:
-                    if low <= value <= high:
-                        return f"{low:.4f}-{high:.4f}"
-                return nan  # For values that don't fall into any bin
-
-            # Apply the binning
-            data[x] = data[x].apply(assign_bin)
+            # Assign each value to the bin with the closest lower bound, bins are not expected to overlap
+            bins = array(self.num_x_bins, dtype=float).reshape(-1, 2)
+            values = data[x].to_numpy(float)
+            if len(bins) == 0:
+                # No bins, all values are dropped by the groupby
+                x_bins = Series(nan, index=data.index, name=x)
+            else:
+                order = argsort(bins[:, 0], kind="stable")
+                lows, highs = bins[order, 0], bins[order, 1]
+                codes = searchsorted(lows, values, side="right") - 1
+                # A value on the boundary shared with the previous bin belongs to the bin listed first
+                prev = maximum(codes - 1, 0)
+                shared = (
+                    (codes > 0)
+                    & (values == lows[codes])
+                    & (values <= highs[prev])
+                    & (order[prev] < order[codes])
+                )
+                codes = where(shared, prev, codes)
+                # Values that don't fall into any bin are dropped by the groupby
+                in_bin = (codes >= 0) & (values <= highs[codes])
+                centers = (lows + highs) / 2
+                x_bins = Series(
+                    where(in_bin, centers[codes], nan), index=data.index, name=x
+                )
 
         # TODO: Find a better way to retain other columns
-        cols = [x]
+        cols = [x_bins]
         if self.by is not None:
             cols.append(self.by)
         if self.peak_color is not None:
@@ -866,17 +925,10 @@ class SpectrumPlot(BaseMSPlot, ABC):
             .reset_index()
         )
 
-        def convert_to_numeric(value):
-            if isinstance(value, Interval):
-                return value.mid
-            elif isinstance(value, str):
-                return mean([float(i) for i in value.split("-")])
-            else:
-                return value
-
-        data[x] = data[x].apply(convert_to_numeric).astype(float)
+        data[x] = data[x].astype(float)
 
-        data = data.fillna(0)
+        # Group keys are never NaN, only bins without any finite intensity need to be filled
+        data[y] = data[y].fillna(0)
         return data
 
     def _prepare_data(
@@ -886,20 +938,16 @@ class SpectrumPlot(BaseMSPlot, ABC):
         y: str,
         reference_spectrum: Union[DataFrame, None],
     ) -> tuple[list, list]:
-        """Prepares data for plotting based on configuration (copy, relative intensity)."""
-
-        # copy spectrum data to not modify the original
-        spectrum = spectrum.copy()
-        reference_spectrum = (
-            self.reference_spectrum.copy() if reference_spectrum is not None else None
-        )
+        """Prepares data for plotting based on configuration (relative intensity, binning)."""
 
         # Convert to relative intensity if required
+        # spectrum is the plot's own copy of the data, only the user supplied reference spectrum needs to be copied
         if self.relative_intensity or self.mirror_spectrum:
-            spectrum[y] = spectrum[y] / spectrum[y].max() * 100
+            spectrum[y] = spectrum[y].to_numpy() * (100.0 / spectrum[y].max())
             if reference_spectrum is not None:
-                reference_spectrum[y] = (
-                    reference_spectrum[y] / reference_spectrum[y].max() * 100
+                reference_spectrum = reference_spectrum.copy()
+                reference_spectrum[y] = reference_spectrum[y].to_numpy() * (
+                    100.0 / reference_spectrum[y].max()
                 )
 
         # Bin peaks if required
@@ -936,38 +984,51 @@ class SpectrumPlot(BaseMSPlot, ABC):
         return ColorGenerator(None, 1)
 
     def _get_annotations(self, data: DataFrame, x: str, y: str):
-        """Create annotations for each peak. Return lists of texts, x and y locations and colors."""
-        color_gen = self._get_colors(data, "annotation")
-
-        data["color"] = [next(color_gen) for _ in range(len(data))]
-
-        ann_texts = []
+        """Create annotations for the top n peaks. Return lists of texts, x and y locations and colors."""
         top_n = self.annotate_top_n_peaks
         if top_n == "all":
             top_n = len(data)
         elif top_n is None:
             top_n = 0
+        # No peaks are annotated, skip building colors and texts altogether
+        if top_n == 0:
+            return [], [], [], []
+
+        color_gen = self._get_colors(data, "annotation")
+        colors = [next(color_gen) for _ in range(len(data))]
+
         # sort values for top intensity peaks on top (ascending for reference spectra with negative values)
-        data = data.sort_values(
-            y, ascending=True if data[y].min() < 0 else False
-        ).reset_index()
-
-        for i, row in data.iterrows():
-            texts = []
-            if i < top_n:
-                if self.annotate_mz:
-                    texts.append(str(round(row[x], 4)))
-                if self.ion_annotation and self.ion_annotation in data.columns:
-                    texts.append(str(row[self.ion_annotation]))
-                if (
-                    self.sequence_annotation
-                    and self.sequence_annotation in data.columns
-                ):
-                    texts.append(str(row[self.sequence_annotation]))
-                if self.custom_annotation and self.custom_annotation in data.columns:
-                    texts.append(str(row[self.custom_annotation]))
-            ann_texts.append("\n".join(texts))
-        return ann_texts, data[x].tolist(), data[y].tolist(), data["color"].tolist()
+        intensities = Series(data[y].to_numpy())
+        top_positions = intensities.sort_values(
+            ascending=True if intensities.min() < 0 else False
+        ).index[:top_n]
+        top_data = data.iloc[top_positions]
+
+        # Build the annotation texts column-wise for the top n peaks only, as only those are drawn by the backends
+        text_parts = []
+        if self.annotate_mz:
+            text_parts.append(top_data[x].map(lambda mz: str(round(mz, 4))))
+        for annotation in (
+            self.ion_annotation,
+            self.sequence_annotation,
+            self.custom_annotation,
+        ):
+            if annotation and annotation in data.columns:
+                text_parts.append(top_data[annotation].astype(str).fillna("nan"))
+
+        if text_parts:
+            top_texts = text_parts[0]
+            for part in text_parts[1:]:
+                top_texts = top_texts + "\n" + part
+            ann_texts = top_texts.tolist()
+        else:
+            ann_texts = [""] * len(top_data)
+        return (
+            ann_texts,
+            top_data[x].tolist(),
+            top_data[y].tolist(),
+            [colors[i] for i in top_positions],
+        )
 
     def _get_ion_color_annotation(self, data: DataFrame) -> str:
         """Retrieve the color associated with a specific ion annotation from a predefined colormap."""
@@ -1061,48 +1122,34 @@ class PeakMapPlot(BaseMSPlot, ABC):
         super().__init__(data, x, y, z=z, **kwargs)
         self._check_and_aggregate_duplicates()
 
+        # Bin edges are only set if the peaks are binned
+        self._bin_edges = None
+
         # Convert intensity values to relative intensity if required
         relative_intensity = kwargs.pop("relative_intensity", False)
         if relative_intensity:
-            self.data[z] = self.data[z] / max(self.data[z]) * 100
+            self.data[z] = self.data[z].to_numpy() * (100.0 / self.data[z].max())
 
         # Bin peaks if required
         if bin_peaks == True or (
             self.data.shape[0] > num_x_bins * num_y_bins and bin_peaks == "auto"
         ):
-            self.data[x] = cut(self.data[x], bins=num_x_bins)
-            self.data[y] = cut(self.data[y], bins=num_y_bins)
             by = kwargs.pop("by", None)
+            self.data = self._bin_peaks(
+                self.data, x, y, z, num_x_bins, num_y_bins, aggregation_method, by
+            )
             if by is not None:
-                # Group by x, y and by columns and calculate the sum intensity within each bin
-                self.data = (
-                    self.data.groupby([x, y, by], observed=True)
-                    .agg({z: aggregation_method})
-                    .reset_index()
-                )
                 # Add by back to kwargs
                 kwargs["by"] = by
-            else:
-                # Group by x and y bins and calculate the sum intensity within each bin
-                self.data = (
-                    self.data.groupby([x, y], observed=True)
-                    .agg({z: aggregation_method})
-                    .reset_index()
-                )
-            self.data[x] = (
-                self.data[x].apply(lambda interval: interval.mid).astype(float)
-            )
-            self.data[y] = (
-                self.data[y].apply(lambda interval: interval.mid).astype(float)
-            )
-            self.data = self.data.fillna(0)
 
         # Log intensity scale
         if z_log_scale:
             self.data[z] = log1p(self.data[z])
 
-        # Sort values by intensity in ascending order to plot highest intensity peaks last
-        self.data.sort_values(z, inplace=True)
+        # Sort values by intensity in ascending order to plot highest intensity peaks last,
+        # the order does not matter if the bins are drawn as a single image
+        if not (fill_by_z and self._use_binned_grid(z)):
+            self.data = self.data.iloc[argsort(self.data[z].to_numpy(), kind="stable")]
 
         # If we do not want to fill/color based on z value, set to none prior to plotting
         if not fill_by_z:
@@ -1110,6 +1157,185 @@ class PeakMapPlot(BaseMSPlot, ABC):
 
         self.plot(x, y, z, **kwargs)
 
+    @staticmethod
+    def _get_bin_range(values, num_bins: int):
+        """
+        Get the start and width of equally spaced bins spanning the range of the values.
+
+        Args:
+            values (numpy.ndarray): The values to bin.
+            num_bins (int): The number of bins.
+
+        Returns:
+            Tuple[float, float]: The lower edge of the first bin and the bin width.
+        """
+        start = values.min()
+        return start, (values.max() - start) / num_bins
+
+    @staticmethod
+    def _get_bin_indices(values, start: float, step: float, num_bins: int):
+        """
+        Assign values to equally spaced bins.
+
+        Args:
+            values (numpy.ndarray): The values to bin.
+            start (float): The lower edge of the first bin.
+            step (float): The bin width.
+            num_bins (int): The number of bins.
+
+        Returns:
+            numpy.ndarray: The bin index of each value.
+        """
+        if step > 0:
+            indices = ((values - start) / step).astype(intp)
+            # The maximum value falls on the last edge, keep it in the last bin
+            clip(indices, 0, num_bins - 1, out=indices)
+        else:
+            indices = zeros(len(values), dtype=intp)
+        return indices
+
+    def _bin_peaks(
+        self,
+        data: DataFrame,
+        x: str,
+        y: str,
+        z: str,
+        num_x_bins: int,
+        num_y_bins: int,
+        aggregation_method: Literal["mean", "sum", "max"],
+        by: str | None = None,
+    ) -> DataFrame:
+        """
+        Bin peaks on a regular x/y grid and aggregate the intensities within each bin.
+
+        Args:
+            data (DataFrame): The data to bin.
+            x (str): The column name for the x-axis data.
+            y (str): The column name for the y-axis data.
+            z (str): The column name for the intensity data.
+            num_x_bins (int): The number of bins along the x-axis.
+            num_y_bins (int): The number of bins along the y-axis.
+            aggregation_method (Literal["mean", "sum", "max"]): How to aggregate the intensities within a bin.
+            by (str | None, optional): Column to additionally group by. Defaults to None.
+
+        Returns:
+            DataFrame: The binned data with one row per bin with a positive intensity, x and y are set to the bin centers.
+        """
+        x_values = data[x].to_numpy(float)
+        y_values = data[y].to_numpy(float)
+        intensities = data[z].to_numpy(float)
+        valid = isfinite(x_values) & isfinite(y_values)
+        if by is not None:
+            by_codes, by_uniques = factorize(data[by], sort=True)
+            valid &= by_codes >= 0
+        # Drop rows without a bin, as groupby did: non-finite x/y would corrupt the
+        # bin edges and missing by labels (code -1) would give negative bin indices
+        if not valid.all():
+            x_values = x_values[valid]
+            y_values = y_values[valid]
+            intensities = intensities[valid]
+            if by is not None:
+                by_codes = by_codes[valid]
+        x_start, x_step = self._get_bin_range(x_values, num_x_bins)
+        y_start, y_step = self._get_bin_range(y_values, num_y_bins)
+        x_edges = x_start + arange(num_x_bins + 1) * x_step
+        y_edges = y_start + arange(num_y_bins + 1) * y_step
+        x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+        y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+        # Keep the edges so backends can draw the bins as a single image
+        self._bin_edges = (x_edges, y_edges)
+
+        grid_size = num_x_bins * num_y_bins
+        num_bins = grid_size
+        if (
+            bin2d_numba is not None
+            and by is None
+            and aggregation_method in ("sum", "mean")
+            and len(intensities) > _numba_binning_threshold
+        ):
+            # Compute the bin indices, sums and counts in a single parallel pass
+            aggregated, counts = bin2d_numba(
+                x_values,
+                y_values,
+                intensities,
+                x_start,
+                x_step,
+                y_start,
+                y_step,
+                num_x_bins,
+                num_y_bins,
+            )
+            if aggregation_method == "mean":
+                aggregated /= maximum(counts, 1)
+        else:
+            x_idx = self._get_bin_indices(x_values, x_start, x_step, num_x_bins)
+            y_idx = self._get_bin_indices(y_values, y_start, y_step, num_y_bins)
+
+            # Flatten the (by, x, y) bin coordinates into a single index
+            flat_idx = x_idx * num_y_bins + y_idx
+            if by is not None:
+                flat_idx += by_codes * grid_size
+                num_bins *= len(by_uniques)
+
+            counts = bincount(flat_idx, minlength=num_bins)
+            if aggregation_method in ("sum", "mean"):
+                aggregated = bincount(
+                    flat_idx, weights=intensities, minlength=num_bins
+                )
+                if aggregation_method == "mean":
+                    aggregated /= maximum(counts, 1)
+            elif aggregation_method == "max":
+                aggregated = full(num_bins, -inf)
+                maximum.at(aggregated, flat_idx, intensities)
+            else:
+                grouped = Series(intensities).groupby(flat_idx).agg(aggregation_method)
+                aggregated = full(num_bins, nan)
+                aggregated[grouped.index] = grouped.to_numpy()
+
+        # Only keep bins which contain peaks with intensity, empty bins would only add blank markers
+        populated = flatnonzero((counts > 0) & (aggregated > 0))
+        grid_idx = populated % grid_size
+        binned = {
+            x: x_centers[grid_idx // num_y_bins],
+            y: y_centers[grid_idx % num_y_bins],
+        }
+        if by is not None:
+            binned[by] = by_uniques[populated // grid_size]
+        # Binned intensities are only used for coloring and marginals, single precision halves the color buffers
+        binned[z] = aggregated[populated].astype(float32)
+        return DataFrame(binned)
+
+    def _use_binned_grid(self, z) -> bool:
+        """
+        Whether the main plot can be drawn as a single 2D image of the bins instead of one marker per bin.
+        Requires binned data colored by intensity, without grouping and in 2D.
+        """
+        if self._bin_edges is None or z is None or self.by is not None or self.plot_3d:
+            return False
+        x_edges, y_edges = self._bin_edges
+        return x_edges[-1] > x_edges[0] and y_edges[-1] > y_edges[0]
+
+    def _get_binned_grid(self, x, y, z):
+        """
+        Reshape the binned data into a 2D intensity grid.
+
+        Args:
+            x (str): The column name for the x-axis data.
+            y (str): The column name for the y-axis data.
+            z (str): The column name for the intensity data.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The x and y bin edges and the intensity grid of shape (num_y_bins, num_x_bins), empty bins are NaN.
+        """
+        x_edges, y_edges = self._bin_edges
+        x_idx = searchsorted(x_edges, self.data[x].to_numpy(), side="right") - 1
+        y_idx = searchsorted(y_edges, self.data[y].to_numpy(), side="right") - 1
+        clip(x_idx, 0, len(x_edges) - 2, out=x_idx)
+        clip(y_idx, 0, len(y_edges) - 2, out=y_idx)
+        grid = full((len(y_edges) - 1, len(x_edges) - 1), nan)
+        grid[y_idx, x_idx] = self.data[z].to_numpy()
+        return x_edges, y_edges, grid
+
     def plot(self, x, y, z, **kwargs):
 
         class_kwargs, other_kwargs = self._separate_class_kwargs(**kwargs)
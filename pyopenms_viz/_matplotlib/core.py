@@ -4,6 +4,7 @@ from abc import ABC
 from typing import Tuple
 import re
 from numpy import nan
+from numpy.ma import masked_invalid
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
@@ -293,25 +294,25 @@ class MATPLOTLIBVLinePlot(MATPLOTLIBPlot, VLinePlot):
             legend_labels = []
 
             if by is None:
-                for _, row in data.iterrows():
+                for x_val, y_val in zip(data[x].to_numpy(), data[y].to_numpy()):
                     if direction == "horizontal":
-                        x_data = [0, row[x]]
-                        y_data = [row[y], row[y]]
+                        x_data = [0, x_val]
+                        y_data = [y_val, y_val]
                     else:
-                        x_data = [row[x], row[x]]
-                        y_data = [0, row[y]]
+                        x_data = [x_val, x_val]
+                        y_data = [0, y_val]
                     (line,) = ax.plot(x_data, y_data, color=next(color_gen))
 
                 return ax, None
             else:
                 for group, df in data.groupby(by):
-                    for _, row in df.iterrows():
+                    for x_val, y_val in zip(df[x].to_numpy(), df[y].to_numpy()):
                         if direction == "horizontal":
-                            x_data = [0, row[x]]
-                            y_data = [row[y], row[y]]
+                            x_data = [0, x_val]
+                            y_data = [y_val, y_val]
                         else:
-                            x_data = [row[x], row[x]]
-                            y_data = [0, row[y]]
+                            x_data = [x_val, x_val]
+                            y_data = [0, y_val]
                         (line,) = ax.plot(x_data, y_data, color=next(color_gen))
                     legend_lines.append(line)
                     legend_labels.append(group)
@@ -492,10 +493,10 @@ class MATPLOTLIBChromatogramPlot(MATPLOTLIB_MSPlot, ChromatogramPlot):
 
         legend_items = []
         legend_labels = []
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
+        for idx, feature in enumerate(annotation_data.itertuples(index=False)):
             use_color = next(color_gen)
             left_vlne = self.fig.vlines(
-                x=feature["leftWidth"],
+                x=feature.leftWidth,
                 ymin=0,
                 ymax=self.data[self.y].max(),
                 lw=self.feature_config.line_width,
@@ -503,7 +504,7 @@ class MATPLOTLIBChromatogramPlot(MATPLOTLIB_MSPlot, ChromatogramPlot):
                 ls=self.feature_config.line_type,
             )
             self.fig.vlines(
-                x=feature["rightWidth"],
+                x=feature.rightWidth,
                 ymin=0,
                 ymax=self.data[self.y].max(),
                 lw=self.feature_config.line_width,
@@ -513,11 +514,11 @@ class MATPLOTLIBChromatogramPlot(MATPLOTLIB_MSPlot, ChromatogramPlot):
             legend_items.append(left_vlne)
 
             if "name" in annotation_data.columns:
-                use_name = feature["name"]
+                use_name = feature.name
             else:
                 use_name = f"Feature {idx}"
             if "q_value" in annotation_data.columns:
-                cur_legend_labels = f"{use_name} (q-value: {feature['q_value']:.4f})"
+                cur_legend_labels = f"{use_name} (q-value: {feature.q_value:.4f})"
             else:
                 cur_legend_labels = f"{use_name}"
             legend_labels.append(cur_legend_labels)
@@ -644,12 +645,37 @@ class MATPLOTLIBPeakMapPlot(MATPLOTLIB_MSPlot, PeakMapPlot):
         self.ax_grid[1, 0].set_ylabel(self.ylabel)
         self.ax_grid[1, 0].set_ylim(self.ax_grid[1, 1].get_ylim())
 
+    def _plot_binned_grid(self, ax, x, y, z, other_kwargs):
+        """
+        Draw the binned peaks as a single QuadMesh instead of one scatter marker per bin.
+
+        Args:
+            ax: The axes object.
+            x (str): The column name for the x-axis data.
+            y (str): The column name for the y-axis data.
+            z (str): The column name for the intensity data.
+            other_kwargs (dict): Additional keyword arguments for the plot.
+        """
+        x_edges, y_edges, grid = self._get_binned_grid(x, y, z)
+        ax.pcolormesh(
+            x_edges,
+            y_edges,
+            masked_invalid(grid),
+            cmap=other_kwargs.get("cmap", "magma_r"),
+            shading="flat",
+            zorder=2,
+        )
+        self._update_plot_aes(ax)
+
     def create_main_plot(self, x, y, z, class_kwargs, other_kwargs):
         if not self.plot_3d:
-            scatterPlot = self.get_scatter_renderer(
-                self.data, x, y, z=z, fig=self.fig, **class_kwargs
-            )
-            scatterPlot.generate(z=z, **other_kwargs)
+            if self._use_binned_grid(z):
+                self._plot_binned_grid(self.fig, x, y, z, other_kwargs)
+            else:
+                scatterPlot = self.get_scatter_renderer(
+                    self.data, x, y, z=z, fig=self.fig, **class_kwargs
+                )
+                scatterPlot.generate(z=z, **other_kwargs)
 
             if self.annotation_data is not None:
                 self._add_box_boundaries(self.annotation_data)
@@ -666,13 +692,16 @@ class MATPLOTLIBPeakMapPlot(MATPLOTLIB_MSPlot, PeakMapPlot):
             )
 
     def create_main_plot_marginals(self, x, y, z, class_kwargs, other_kwargs):
-        scatterPlot = self.get_scatter_renderer(
-            self.data, x, y, z=z, fig=self.ax_grid[1, 1], **class_kwargs
-        )
-        scatterPlot.generate(
-            z=z,
-            **other_kwargs,
-        )
+        if self._use_binned_grid(z):
+            self._plot_binned_grid(self.ax_grid[1, 1], x, y, z, other_kwargs)
+        else:
+            scatterPlot = self.get_scatter_renderer(
+                self.data, x, y, z=z, fig=self.ax_grid[1, 1], **class_kwargs
+            )
+            scatterPlot.generate(
+                z=z,
+                **other_kwargs,
+            )
         self.ax_grid[1, 1].set_title(None)
         self.ax_grid[1, 1].set_xlabel(self.xlabel)
         self.ax_grid[1, 1].set_ylabel(None)
@@ -690,11 +719,11 @@ class MATPLOTLIBPeakMapPlot(MATPLOTLIB_MSPlot, PeakMapPlot):
         )
         legend_items = []
 
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
-            x0 = feature["leftWidth"]
-            x1 = feature["rightWidth"]
-            y0 = feature["IM_leftWidth"]
-            y1 = feature["IM_rightWidth"]
+        for idx, feature in enumerate(annotation_data.itertuples(index=False)):
+            x0 = feature.leftWidth
+            x1 = feature.rightWidth
+            y0 = feature.IM_leftWidth
+            y1 = feature.IM_rightWidth
 
             # Calculate center points and dimensions
             width = abs(x1 - x0)
@@ -713,11 +742,11 @@ class MATPLOTLIBPeakMapPlot(MATPLOTLIB_MSPlot, PeakMapPlot):
             self.fig.add_patch(custom_lines)
 
             if "name" in annotation_data.columns:
-                use_name = feature["name"]
+                use_name = feature.name
             else:
                 use_name = f"Feature {idx}"
             if "q_value" in annotation_data.columns:
-                legend_labels = f"{use_name} (q-value: {feature['q_value']:.4f})"
+                legend_labels = f"{use_name} (q-value: {feature.q_value:.4f})"
             else:
                 legend_labels = f"{use_name}"
 
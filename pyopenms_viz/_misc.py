@@ -6,6 +6,11 @@ from itertools import cycle
 from typing import Literal
 import warnings
 
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    njit = None
+
 
 class ColorGenerator:
     """
@@ -343,4 +348,63 @@ def is_latex_formatted(text):
         if re.search(pattern, text):
             return True
     
-    return False
\ No newline at end of file
+    return False
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _bin2d_kernel(
+        x, y, z, x_start, x_step, y_start, y_step, num_x_bins, num_y_bins, num_chunks
+    ):
+        n = len(z)
+        chunk_size = (n + num_chunks - 1) // num_chunks
+        # Each chunk accumulates into its own buffer, the buffers are combined at the end
+        sums = np.zeros((num_chunks, num_x_bins * num_y_bins))
+        counts = np.zeros((num_chunks, num_x_bins * num_y_bins), dtype=np.int64)
+        for c in prange(num_chunks):
+            for i in range(c * chunk_size, min(n, (c + 1) * chunk_size)):
+                x_bin = 0
+                if x_step > 0:
+                    x_bin = min(max(int((x[i] - x_start) / x_step), 0), num_x_bins - 1)
+                y_bin = 0
+                if y_step > 0:
+                    y_bin = min(max(int((y[i] - y_start) / y_step), 0), num_y_bins - 1)
+                k = x_bin * num_y_bins + y_bin
+                sums[c, k] += z[i]
+                counts[c, k] += 1
+        return sums.sum(axis=0), counts.sum(axis=0)
+
+    def bin2d_numba(x, y, z, x_start, x_step, y_start, y_step, num_x_bins, num_y_bins):
+        """
+        Sum and count values on a regular 2D grid in a single parallel pass, only available if numba is installed.
+
+        Args:
+            x (np.ndarray): The x coordinates.
+            y (np.ndarray): The y coordinates.
+            z (np.ndarray): The values to sum.
+            x_start (float): The lower edge of the first x bin.
+            x_step (float): The width of the x bins.
+            y_start (float): The lower edge of the first y bin.
+            y_step (float): The width of the y bins.
+            num_x_bins (int): The number of bins along x.
+            num_y_bins (int): The number of bins along y.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The sum and count of each bin, flattened with index x_bin * num_y_bins + y_bin.
+        """
+        return _bin2d_kernel(
+            x,
+            y,
+            z,
+            x_start,
+            x_step,
+            y_start,
+            y_step,
+            num_x_bins,
+            num_y_bins,
+            get_num_threads(),
+        )
+
+else:
+    bin2d_numba = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
+from functools import lru_cache
 
 from typing import List, Tuple, Union
 
@@ -8,9 +9,28 @@ import plotly.graph_objects as go
 from plotly.graph_objs import Figure
 from plotly.subplots import make_subplots
 
+from pandas import Series, factorize
 from pandas.core.frame import DataFrame
 
-from numpy import column_stack, log, nan
+from numpy import (
+    arange,
+    argsort,
+    broadcast_to,
+    column_stack,
+    diff,
+    empty,
+    flatnonzero,
+    full,
+    log,
+    nan,
+    nanmax,
+    nanmin,
+    nan_to_num,
+    repeat,
+    result_type,
+    split,
+    zeros_like,
+)
 
 from .._core import (
     BasePlot,
@@ -30,6 +50,131 @@ from .._misc import ColorGenerator, MarkerShapeGenerator, is_latex_formatted
 from ..constants import PEAK_BOUNDARY_ICON, FEATURE_BOUNDARY_ICON
 
 
+# Theme settings shared by all plots, only the size and grid settings depend on the plot
+_STATIC_LAYOUT = dict(
+    plot_bgcolor="#FFFFFF",
+    font_family="Helvetica",
+    title_font_family="Helvetica",
+    xaxis_title_font_family="Helvetica",
+    yaxis_title_font_family="Helvetica",
+    xaxis_gridcolor="#CCCCCC",
+    yaxis_gridcolor="#CCCCCC",
+    xaxis_tickfont_family="Helvetica",
+    yaxis_tickfont_family="Helvetica",
+    legend_font_family="Helvetica",
+)
+_STATIC_XAXIS = dict(
+    showline=True,
+    linewidth=1,
+    linecolor="black",
+    ticks="outside",
+    tickwidth=1,
+    tickcolor="black",
+)
+_STATIC_YAXIS = dict(
+    showline=True,
+    linewidth=1,
+    linecolor="black",
+    tickwidth=1,
+    tickcolor="black",
+)
+
+
+# Number of points above which traces are rendered with WebGL, as done by plotly express
+_WEBGL_THRESHOLD = 1000
+
+
+def _scatter_type(num_points: int, render_mode: str = "auto") -> str:
+    """
+    Get the Plotly trace type for a scatter or line trace.
+
+    Args:
+        num_points (int): The number of points in the plot.
+        render_mode (str, optional): "svg", "webgl" or "auto" to use WebGL above
+            _WEBGL_THRESHOLD points. Defaults to "auto".
+
+    Returns:
+        str: "scattergl" or "scatter".
+    """
+    if render_mode == "webgl" or (
+        render_mode == "auto" and num_points > _WEBGL_THRESHOLD
+    ):
+        return "scattergl"
+    return "scatter"
+
+
+def _split_by_group(values: Series) -> dict:
+    """
+    Get the row positions of each group, like DataFrame.groupby(...).indices.
+
+    Args:
+        values (Series): The group label of each row.
+
+    Returns:
+        dict: The row positions of each group, ordered by group label.
+    """
+    codes, uniques = factorize(values, sort=True)
+    # Rows with a missing label belong to no group, as in groupby
+    rows = flatnonzero(codes >= 0)
+    order = rows[argsort(codes[rows], kind="stable")]
+    boundaries = flatnonzero(diff(codes[order])) + 1
+    return dict(zip(uniques, split(order, boundaries)))
+
+
+@lru_cache(maxsize=32)
+def _tooltip_template(labels: Tuple[str, ...], index: bool) -> str:
+    """
+    Build the hovertemplate for the given tooltip labels.
+
+    Args:
+        labels (Tuple[str, ...]): Tooltip labels, in the order of the customdata columns.
+        index (bool): Whether the first customdata column holds the index.
+
+    Returns:
+        str: The hovertemplate string.
+    """
+    tooltips = []
+    # Add tooltip text for index if required
+    if index:
+        tooltips.append("index: %{customdata[0]}")
+    offset = 1 if index else 0
+    for i, label in enumerate(labels, start=offset):
+        tooltips.append(f"{label}" + ": %{customdata[" + str(i) + "]}")
+    return "<br>".join(tooltips)
+
+
+@lru_cache(maxsize=8)
+def _marginal_subplots(x_title: str, y_title: str) -> Figure:
+    """
+    Build the empty 2x2 subplot grid of a peak map with marginal plots.
+
+    The returned figure is shared, copy it with go.Figure before adding traces.
+
+    Args:
+        x_title (str): Title of the x-axis marginal plot.
+        y_title (str): Title of the y-axis marginal plot.
+
+    Returns:
+        Figure: The empty subplot figure.
+    """
+    return make_subplots(
+        rows=2,
+        cols=2,
+        shared_xaxes=True,
+        shared_yaxes=True,
+        vertical_spacing=0,
+        horizontal_spacing=0,
+        subplot_titles=(None, x_title, y_title, None),
+        specs=[
+            [{}, {"type": "xy", "rowspan": 1, "secondary_y": True}],
+            [
+                {"type": "xy", "rowspan": 1, "secondary_y": False},
+                {"type": "xy", "rowspan": 1, "secondary_y": False},
+            ],
+        ],
+    )
+
+
 class PLOTLYPlot(BasePlot, ABC):
     """
     Base class for assembling a Ploty plot
@@ -55,67 +200,42 @@ class PLOTLYPlot(BasePlot, ABC):
         Create a new figure, if a figure is not supplied
         """
         if self.fig is None:
-            self.fig = go.Figure()
-            self.fig.update_layout(
-                title=self.title,
-                xaxis_title=self.xlabel,
-                yaxis_title=self.ylabel,
-                width=self.width,
-                height=self.height,
-                template="simple_white",
-                dragmode="select",
+            self.fig = go.Figure(
+                layout=dict(
+                    title=self.title,
+                    xaxis_title=self.xlabel,
+                    yaxis_title=self.ylabel,
+                    width=self.width,
+                    height=self.height,
+                    template="simple_white",
+                    dragmode="select",
+                )
             )
 
     def _update_plot_aes(self, fig, **kwargs) -> None:
         """
         Update the plot aesthetics.
         """
-        fig.update_layout(
+        aes = dict(
             legend_title=self.legend.title,
             legend_font_size=self.legend.fontsize,
             showlegend=self.legend.show,
+            title_font_size=self.title_font_size,
+            xaxis_title_font_size=self.xaxis_label_font_size,
+            yaxis_title_font_size=self.yaxis_label_font_size,
+            xaxis_tickfont_size=self.xaxis_tick_font_size,
+            yaxis_tickfont_size=self.yaxis_tick_font_size,
         )
+        # Skip if these aesthetics were already applied to the figure, e.g. mirror spectra
+        signature = (tuple(aes.values()), self.grid)
+        if getattr(fig, "_pyopenms_aes_signature", None) == signature:
+            return
         # Update to look similar to Bokeh theme
-        # Customize the layout
-        fig.update_layout(
-            plot_bgcolor="#FFFFFF",  # Set the plot background color
-            font_family="Helvetica",  # Set the font family
-            # font_size=12,  # Set the font size
-            title_font_family="Helvetica",  # Set the title font family
-            title_font_size=self.title_font_size,  # Set the title font size
-            xaxis_title_font_family="Helvetica",  # Set the x-axis title font family
-            xaxis_title_font_size=self.xaxis_label_font_size,  # Set the x-axis title font size
-            yaxis_title_font_family="Helvetica",  # Set the y-axis title font family
-            yaxis_title_font_size=self.yaxis_label_font_size,  # Set the y-axis title font size
-            xaxis_gridcolor="#CCCCCC",  # Set the x-axis grid color
-            yaxis_gridcolor="#CCCCCC",  # Set the y-axis grid color
-            xaxis_tickfont_size=self.xaxis_tick_font_size,  # Set the x-axis tick font size
-            xaxis_tickfont_family="Helvetica",  # Set the x-axis tick font family
-            yaxis_tickfont_size=self.yaxis_tick_font_size,  # Set the y-axis tick font size
-            yaxis_tickfont_family="Helvetica",  # Set the y-axis tick font family
-            legend_font_family="Helvetica",  # Set the legend font family
-        )
-
-        # Add x-axis grid lines and ticks
-        fig.update_xaxes(
-            showgrid=self.grid,  # Add x-axis grid lines
-            showline=True,
-            linewidth=1,
-            linecolor="black",
-            ticks="outside",  # Add x-axis ticks outside the plot area
-            tickwidth=1,  # Set the width of x-axis ticks
-            tickcolor="black",  # Set the color of x-axis ticks
-        )
-
-        # Add y-axis grid lines and ticks
-        fig.update_yaxes(
-            showgrid=self.grid,  # Add y-axis grid lines
-            showline=True,
-            linewidth=1,
-            linecolor="black",
-            tickwidth=1,  # Set the width of y-axis ticks
-            tickcolor="black",  # Set the color of y-axis ticks
-        )
+        fig.update_layout(_STATIC_LAYOUT, **aes)
+        # Add grid lines and ticks to all axes
+        fig.update_xaxes(_STATIC_XAXIS, showgrid=self.grid)
+        fig.update_yaxes(_STATIC_YAXIS, showgrid=self.grid)
+        fig._pyopenms_aes_signature = signature
 
     def _add_legend(self, fig, legend):
         pass
@@ -123,10 +243,12 @@ class PLOTLYPlot(BasePlot, ABC):
     def _add_tooltips(self, fig, tooltips, custom_hover_data=None):
         # In case figure is constructed of multiple traces (e.g. one trace per MS peak) add annotation for each point in trace
         if len(fig.data) > 1:
+            fig.update_traces(hovertemplate=tooltips)
             for i in range(len(fig.data)):
-                fig.data[i].update(
-                    hovertemplate=tooltips,
-                    customdata=[custom_hover_data[i, :]] * len(fig.data[i].x),
+                # Repeat the row of the trace as a view instead of a list of row copies
+                fig.data[i].customdata = broadcast_to(
+                    custom_hover_data[i, :],
+                    (len(fig.data[i].x), custom_hover_data.shape[1]),
                 )
             return
         fig.update_traces(hovertemplate=tooltips, customdata=custom_hover_data)
@@ -197,6 +319,9 @@ class PLOTLYPlot(BasePlot, ABC):
         self.fig.update_yaxes(range=[start, end])
 
     def show_default(self, **kwargs):
+        # The figure is assembled from validated objects, skip validating it again.
+        # Plotly serializes it with orjson when installed (plotly extra).
+        kwargs.setdefault("validate", False)
         self.fig.show(**kwargs)
 
     def show_sphinx(self):
@@ -221,12 +346,15 @@ class PLOTLYLinePlot(PLOTLYPlot, LinePlot):
         **kwargs,
     ) -> Tuple[Figure, "Legend"]:  # note legend is always none for consistency
         color_gen = kwargs.pop("line_color", None)
+        trace_type = _scatter_type(len(data), kwargs.pop("render_mode", "auto"))
 
+        # Traces are passed as dicts, they are validated once when added to the figure
         traces = []
         if by is None:
-            trace = go.Scatter(
-                x=data[x],
-                y=data[y],
+            trace = dict(
+                type=trace_type,
+                x=data[x].to_numpy(),
+                y=data[y].to_numpy(),
                 mode="lines",
                 line=dict(
                     color=color_gen if isinstance(color_gen, str) else next(color_gen)
@@ -234,23 +362,33 @@ class PLOTLYLinePlot(PLOTLYPlot, LinePlot):
             )
             traces.append(trace)
         else:
-            for group, df in data.groupby(by):
-                trace = go.Scatter(
-                    x=df[x],
-                    y=df[y],
+            x_values = data[x].to_numpy()
+            y_values = data[y].to_numpy()
+            groups = _split_by_group(data[by])
+            # Draw one color per group up front
+            if isinstance(color_gen, str):
+                colors = [color_gen] * len(groups)
+            else:
+                colors = [next(color_gen) for _ in range(len(groups))]
+            for (group, rows), color in zip(groups.items(), colors):
+                trace = dict(
+                    type=trace_type,
+                    x=x_values[rows],
+                    y=y_values[rows],
                     mode="lines",
                     name=group,
-                    line=dict(
-                        color=(
-                            color_gen if isinstance(color_gen, str) else next(color_gen)
-                        )
-                    ),
+                    line=dict(color=color),
                 )
                 traces.append(trace)
 
         fig.add_traces(data=traces)
         return fig, None
 
+    def _make_plot(self, fig, **kwargs) -> None:
+        if self.render_mode is not None:
+            kwargs.setdefault("render_mode", self.render_mode)
+        super()._make_plot(fig, **kwargs)
+
 
 class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
 
@@ -265,54 +403,43 @@ class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
 
         if not plot_3d:
             direction = kwargs.pop("direction", "vertical")
+            # Row positions of the peaks in each segment trace, keyed by trace index
+            segment_rows = kwargs.pop("_segment_rows", None)
             traces = []
             if by is None:
-                for _, row in data.iterrows():
-                    line_color = next(color_gen)
-                    if direction == "horizontal":
-                        x_data = [0, row[x]]
-                        y_data = [row[y]] * 2
-                    else:
-                        x_data = [row[x]] * 2
-                        y_data = [0, row[y]]
-
-                    trace = go.Scattergl(
+                groups = {"": arange(len(data))}
+                first_group_trace_showlenged = False
+            else:
+                groups = _split_by_group(data[by])
+                first_group_trace_showlenged = kwargs.get("showlegend", True)
+            # Colors are drawn row by row in group order
+            colors = [next(color_gen) for _ in range(len(data))]
+            color_offset = 0
+            for group, positions in groups.items():
+                group_colors = colors[color_offset : color_offset + len(positions)]
+                color_offset += len(positions)
+                # Draw all lines of the same color as one trace of segments separated by gaps
+                color_codes, line_colors = factorize(Series(group_colors, dtype=object))
+                showlegend = first_group_trace_showlenged
+                for code, line_color in enumerate(line_colors):
+                    rows = positions[color_codes == code]
+                    x_data, y_data = cls._get_line_segments(
+                        data[x].to_numpy()[rows], data[y].to_numpy()[rows], direction
+                    )
+                    trace = dict(
+                        type="scattergl",
                         x=x_data,
                         y=y_data,
                         mode="lines",
-                        name="",
-                        showlegend=False,
+                        name=group,
+                        legendgroup=group if by is not None else None,
+                        showlegend=showlegend,
                         line=dict(color=line_color),
                     )
-                    first_group_trace_showlenged = False
+                    showlegend = False
+                    if segment_rows is not None:
+                        segment_rows[len(fig.data) + len(traces)] = rows
                     traces.append(trace)
-            else:
-                for group, df in data.groupby(by):
-                    if "showlegend" in kwargs:
-                        showlegend = kwargs["showlegend"]
-                        first_group_trace_showlenged = showlegend
-                    else:
-                        first_group_trace_showlenged = True
-                    for _, row in df.iterrows():
-                        if direction == "horizontal":
-                            x_data = [0, row[x]]
-                            y_data = [row[y]] * 2
-                        else:
-                            x_data = [row[x]] * 2
-                            y_data = [0, row[y]]
-
-                        line_color = next(color_gen)
-                        trace = go.Scattergl(
-                            x=x_data,
-                            y=y_data,
-                            mode="lines",
-                            name=group,
-                            legendgroup=group,
-                            showlegend=first_group_trace_showlenged,
-                            line=dict(color=line_color),
-                        )
-                        first_group_trace_showlenged = False
-                        traces.append(trace)
 
             fig.add_traces(data=traces)
         else:
@@ -322,22 +449,11 @@ class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
             ylabel = kwargs.pop("ylabel", "Y")
             zlabel = kwargs.pop("zlabel", "Z")
             if by is None:
-                x_vert = []
-                y_vert = []
-                z_vert = []
                 z_min = data[z].min()
                 z_max = data[z].max()
-                for x_val, y_val, z_val in zip(data[x], data[y], data[z]):
-                    for i in range(2):
-                        x_vert.append(x_val)
-                        y_vert.append(y_val)
-                        if i == 0:
-                            z_vert.append(0)
-                        else:
-                            z_vert.append(z_val)
-                    x_vert.append(None)
-                    y_vert.append(None)
-                    z_vert.append(None)
+                x_vert, y_vert, z_vert = cls._get_line_segments_3d(
+                    data[x].to_numpy(), data[y].to_numpy(), data[z].to_numpy()
+                )
 
                 fig.add_trace(
                     go.Scatter3d(
@@ -347,7 +463,7 @@ class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
                         mode="lines",
                         line=dict(
                             width=5,
-                            color=[z if z is not None else 0 for z in z_vert],
+                            color=nan_to_num(z_vert),
                             colorscale="magma_r",
                             cmin=z_min,
                             cmax=z_max,
@@ -367,24 +483,9 @@ class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
                 for group, df in data.groupby(by):
                     use_color = next(color_gen)
                     # Transform to vertical line data with no connections
-                    x_vert = []
-                    y_vert = []
-                    z_vert = []
-                    for (
-                        x_val,
-                        y_val,
-                        z_val,
-                    ) in zip(df[x], df[y], df[z]):
-                        for i in range(2):
-                            x_vert.append(x_val)
-                            y_vert.append(y_val)
-                            if i == 0:
-                                z_vert.append(0)
-                            else:
-                                z_vert.append(z_val)
-                        x_vert.append(None)
-                        y_vert.append(None)
-                        z_vert.append(None)
+                    x_vert, y_vert, z_vert = cls._get_line_segments_3d(
+                        df[x].to_numpy(), df[y].to_numpy(), df[z].to_numpy()
+                    )
 
                     fig.add_trace(
                         go.Scatter3d(
@@ -465,6 +566,71 @@ class PLOTLYVLinePlot(PLOTLYPlot, VLinePlot):
         for annotation in annotations:
             fig.add_annotation(annotation)
 
+    @staticmethod
+    def _get_line_segments(xs, ys, direction="vertical"):
+        """
+        Build the coordinates of lines from the axis to each value, separated by gaps so they can be drawn as one trace.
+
+        Args:
+            xs (numpy.ndarray): The x values.
+            ys (numpy.ndarray): The y values.
+            direction (str, optional): "vertical" for lines from y=0, "horizontal" for lines from x=0. Defaults to "vertical".
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The x and y coordinates, three points per line.
+        """
+        x_data = full(3 * len(xs), nan)
+        y_data = full(3 * len(ys), nan)
+        if direction == "horizontal":
+            x_data[0::3] = 0
+            x_data[1::3] = xs
+            y_data[0::3] = ys
+            y_data[1::3] = ys
+        else:
+            x_data[0::3] = xs
+            x_data[1::3] = xs
+            y_data[0::3] = 0
+            y_data[1::3] = ys
+        return x_data, y_data
+
+    @staticmethod
+    def _get_line_segments_3d(xs, ys, zs):
+        """
+        Build the coordinates of lines from z=0 to each value, separated by gaps so they can be drawn as one trace.
+
+        Args:
+            xs (numpy.ndarray): The x values.
+            ys (numpy.ndarray): The y values.
+            zs (numpy.ndarray): The z values.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The x, y and z coordinates, three points per line.
+        """
+        x_data = repeat(xs.astype(float), 3)
+        y_data = repeat(ys.astype(float), 3)
+        z_data = full(3 * len(zs), nan)
+        x_data[2::3] = nan
+        y_data[2::3] = nan
+        z_data[0::3] = 0
+        z_data[1::3] = zs
+        return x_data, y_data, z_data
+
+    def _make_plot(self, fig, **kwargs) -> None:
+        self._segment_rows = {}
+        super()._make_plot(fig, _segment_rows=self._segment_rows, **kwargs)
+
+    def _add_tooltips(self, fig, tooltips, custom_hover_data=None):
+        # Each segment trace holds three points per peak, look up the hover data of its rows
+        for trace_idx, rows in self._segment_rows.items():
+            trace = fig.data[trace_idx]
+            if custom_hover_data is None:
+                trace.update(hovertemplate=tooltips)
+            else:
+                trace.update(
+                    hovertemplate=tooltips,
+                    customdata=custom_hover_data[repeat(rows, 3)],
+                )
+
 
 class PLOTLYScatterPlot(PLOTLYPlot, ScatterPlot):
 
@@ -481,19 +647,21 @@ class PLOTLYScatterPlot(PLOTLYPlot, ScatterPlot):
             marker_gen = MarkerShapeGenerator(engine="PLOTLY")
         marker_dict = kwargs.pop("marker", dict())
         marker_size = kwargs.pop("marker_size", 10)
+        trace_type = _scatter_type(len(data), kwargs.pop("render_mode", "webgl"))
         # Check for z-dimension and plot heatmap
         z = kwargs.pop("z", None)
         # Plotting heatmaps with z dimension overwrites marker_dict.
         if z:
+            z_values = data[z].to_numpy()
             # Default values for heatmap
             heatmap_defaults = dict(
-                color=data[z],
+                color=z_values,
                 colorscale="Inferno_r",
                 showscale=False,
                 size=marker_size,
                 opacity=0.8,
-                cmin=data[z].min(),
-                cmax=data[z].max(),
+                cmin=nanmin(z_values),
+                cmax=nanmax(z_values),
             )
             # If no marker_dict was in kwargs, use default for heatmpas
             if not marker_dict:
@@ -504,30 +672,41 @@ class PLOTLYScatterPlot(PLOTLYPlot, ScatterPlot):
                     if k not in marker_dict.keys():
                         marker_dict[k] = v
 
-        marker_dict["color"] = data[z] if z else next(color_gen)
+        if z:
+            marker_dict["color"] = z_values
+        elif by is None:
+            marker_dict["color"] = next(color_gen)
         traces = []
         if by is None:
             marker_dict["symbol"] = next(marker_gen)
-            trace = go.Scattergl(
-                x=data[x],
-                y=data[y],
+            trace = dict(
+                type=trace_type,
+                x=data[x].to_numpy(),
+                y=data[y].to_numpy(),
                 mode="markers",
                 marker=marker_dict,
                 showlegend=False,
             )
             traces.append(trace)
         else:
-            for group, df in data.groupby(by):
-                marker_dict["symbol"] = next(marker_gen)
-                marker_dict["color"] = next(color_gen)
+            x_values = data[x].to_numpy()
+            y_values = data[y].to_numpy()
+            groups = _split_by_group(data[by])
+            # Draw one symbol and color per group up front
+            symbols = [next(marker_gen) for _ in range(len(groups))]
+            colors = [next(color_gen) for _ in range(len(groups))]
+            for (group, rows), symbol, color in zip(groups.items(), symbols, colors):
+                marker_dict["symbol"] = symbol
+                marker_dict["color"] = color
                 if z is not None:
-                    marker_dict["color"] = df[z]
-                trace = go.Scatter(
-                    x=df[x],
-                    y=df[y],
+                    marker_dict["color"] = z_values[rows]
+                trace = dict(
+                    type=trace_type,
+                    x=x_values[rows],
+                    y=y_values[rows],
                     mode="markers",
                     name=group,
-                    marker=marker_dict,
+                    marker=marker_dict.copy(),
                     **kwargs,
                 )
                 traces.append(trace)
@@ -535,6 +714,11 @@ class PLOTLYScatterPlot(PLOTLYPlot, ScatterPlot):
         fig.add_traces(data=traces)
         return fig, None
 
+    def _make_plot(self, fig, **kwargs) -> None:
+        if self.render_mode is not None:
+            kwargs.setdefault("render_mode", self.render_mode)
+        super()._make_plot(fig, **kwargs)
+
 
 class PLOTLY_MSPlot(BaseMSPlot, PLOTLYPlot, ABC):
 
@@ -551,27 +735,20 @@ class PLOTLY_MSPlot(BaseMSPlot, PLOTLYPlot, ABC):
         fig.add_hline(y=0, line_color="black", line=dict(width=1))
 
     def _create_tooltips(self, entries, index=True):
-        custom_hover_data = []
+        columns = []
         # Add data from index if required
         if index:
-            custom_hover_data.append(self.data.index)
+            columns.append(self.data.index.to_numpy())
         # Get the rest of the columns
-        custom_hover_data += [self.data[col] for col in entries.values()]
-
-        tooltips = []
-        # Add tooltip text for index if required
-        if index:
-            tooltips.append("index: %{customdata[0]}")
-
-        custom_hover_data_index = 1 if index else 0
-
-        for key in entries.keys():
-            tooltips.append(
-                f"{key}" + ": %{customdata[" + str(custom_hover_data_index) + "]}"
-            )
-            custom_hover_data_index += 1
+        columns += [self.data[col].to_numpy() for col in entries.values()]
+        # Fill a preallocated array instead of column_stack to avoid intermediate copies
+        custom_hover_data = empty(
+            (len(self.data), len(columns)), dtype=result_type(*columns)
+        )
+        for i, column in enumerate(columns):
+            custom_hover_data[:, i] = column
 
-        return "<br>".join(tooltips), column_stack(custom_hover_data)
+        return _tooltip_template(tuple(entries.keys()), index), custom_hover_data
 
 
 class PLOTLYChromatogramPlot(PLOTLY_MSPlot, ChromatogramPlot):
@@ -580,32 +757,40 @@ class PLOTLYChromatogramPlot(PLOTLY_MSPlot, ChromatogramPlot):
         color_gen = ColorGenerator(
             colormap=self.feature_config.colormap, n=annotation_data.shape[0]
         )
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
-            if "q_value" in annotation_data.columns:
-                legend_label = f"Feature {idx} (q-value: {feature['q_value']:.4f})"
+        line_dash = bokeh_line_dash_mapper(self.feature_config.line_type, "plotly")
+        # Coordinates of all boundaries, one row per feature
+        left = annotation_data["leftWidth"].to_numpy()
+        right = annotation_data["rightWidth"].to_numpy()
+        apex = annotation_data["apexIntensity"].to_numpy()
+        boundary_x = column_stack([left, left, right, right])
+        boundary_y = column_stack([apex, zeros_like(apex), zeros_like(apex), apex])
+        if "q_value" in annotation_data.columns:
+            q_values = annotation_data["q_value"].to_numpy()
+        else:
+            q_values = None
+        # Collect all boundaries first, every add_trace call revalidates the figure data
+        traces = []
+        for idx in range(len(annotation_data)):
+            if q_values is not None:
+                legend_label = f"Feature {idx} (q-value: {q_values[idx]:.4f})"
             else:
                 legend_label = f"Feature {idx}"
-            self.fig.add_trace(
-                go.Scatter(
+            traces.append(
+                dict(
+                    type="scatter",
                     mode="lines",
-                    x=[
-                        feature["leftWidth"],
-                        feature["leftWidth"],
-                        feature["rightWidth"],
-                        feature["rightWidth"],
-                    ],
-                    y=[feature["apexIntensity"], 0, 0, feature["apexIntensity"]],
+                    x=boundary_x[idx],
+                    y=boundary_y[idx],
                     opacity=0.5,
                     line=dict(
                         color=next(color_gen),
-                        dash=bokeh_line_dash_mapper(
-                            self.feature_config.line_type, "plotly"
-                        ),
+                        dash=line_dash,
                         width=self.feature_config.line_width,
                     ),
                     name=legend_label,
                 )
             )
+        self.fig.add_traces(traces)
 
     def get_manual_bounding_box_coords(self, arg):
         # TODO: Implement this method, plotly doesn't have a direct easy way of extracting the relayout events. Would need to implement / add a dash dependency to add a callback to extract the relayout events
@@ -622,21 +807,52 @@ class PLOTLYSpectrumPlot(PLOTLY_MSPlot, SpectrumPlot):
 
 class PLOTLYPeakMapPlot(PLOTLY_MSPlot, PeakMapPlot):
 
+    def _plot_binned_grid(self, x, y, z):
+        """
+        Draw the binned peaks as a single heatmap trace instead of one scatter marker per bin.
+
+        Args:
+            x (str): The column name for the x-axis data.
+            y (str): The column name for the y-axis data.
+            z (str): The column name for the intensity data.
+        """
+        x_edges, y_edges, grid = self._get_binned_grid(x, y, z)
+        trace = go.Heatmap(
+            z=grid,
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            colorscale="Inferno_r",
+            showscale=False,
+            zmin=self.data[z].min(),
+            zmax=self.data[z].max(),
+            hoverongaps=False,
+            hovertemplate=f"{self.xlabel}: %{{x}}<br>{self.ylabel}: %{{y}}<br>{self.zlabel}: %{{z}}<extra></extra>",
+        )
+        self.fig.add_trace(trace)
+        self._update_plot_aes(self.fig)
+
     def create_main_plot(self, x, y, z, class_kwargs, other_kwargs):
         if not self.plot_3d:
-            scatterPlot = self.get_scatter_renderer(self.data, x, y, **class_kwargs)
-            self.fig = scatterPlot.generate(z=z, **other_kwargs)
-
-            if z is not None:
-                tooltips, custom_hover_data = self._create_tooltips(
-                    {self.xlabel: x, self.ylabel: y, self.zlabel: z}
-                )
+            if self._use_binned_grid(z):
+                self._plot_binned_grid(x, y, z)
             else:
-                tooltips, custom_hover_data = self._create_tooltips(
-                    {self.xlabel: x, self.ylabel: y}
+                scatterPlot = self.get_scatter_renderer(
+                    self.data, x, y, **class_kwargs
                 )
+                self.fig = scatterPlot.generate(z=z, **other_kwargs)
+
+                if z is not None:
+                    tooltips, custom_hover_data = self._create_tooltips(
+                        {self.xlabel: x, self.ylabel: y, self.zlabel: z}
+                    )
+                else:
+                    tooltips, custom_hover_data = self._create_tooltips(
+                        {self.xlabel: x, self.ylabel: y}
+                    )
 
-            self._add_tooltips(self.fig, tooltips, custom_hover_data=custom_hover_data)
+                self._add_tooltips(
+                    self.fig, tooltips, custom_hover_data=custom_hover_data
+                )
 
             if self.annotation_data is not None:
                 self._add_box_boundaries(self.annotation_data)
@@ -672,101 +888,90 @@ class PLOTLYPeakMapPlot(PLOTLY_MSPlot, PeakMapPlot):
         #############
         ##  Combine Plots
 
-        # Create a figure with subplots
-        fig_m = make_subplots(
-            rows=2,
-            cols=2,
-            shared_xaxes=True,
-            shared_yaxes=True,
-            vertical_spacing=0,
-            horizontal_spacing=0,
-            subplot_titles=(
-                None,
-                f"Integrated {self.xlabel}",
-                f"Integrated {self.ylabel}",
-                None,
-            ),
-            specs=[
-                [{}, {"type": "xy", "rowspan": 1, "secondary_y": True}],
-                [
-                    {"type": "xy", "rowspan": 1, "secondary_y": False},
-                    {"type": "xy", "rowspan": 1, "secondary_y": False},
-                ],
-            ],
+        # Create a figure with subplots, copied from the cached empty grid
+        fig_m = go.Figure(
+            _marginal_subplots(
+                f"Integrated {self.xlabel}", f"Integrated {self.ylabel}"
+            )
         )
 
         # Add the heatmap to the first row
         for trace in self.fig.data:
             trace.showlegend = False
             trace.legendgroup = trace.name
-            fig_m.add_trace(trace, row=2, col=2, secondary_y=False)
+        n_traces = len(self.fig.data)
+        fig_m.add_traces(
+            self.fig.data,
+            rows=[2] * n_traces,
+            cols=[2] * n_traces,
+            secondary_ys=[False] * n_traces,
+        )
 
-        # Update the heatmao layout
+        # Update the heatmap layout
         fig_m.update_layout(self.fig.layout)
-        fig_m.update_yaxes(row=2, col=2, secondary_y=False)
 
         # Add the x-axis plot to the second row
         for trace in x_fig.data:
-
             trace.legendgroup = trace.name
-            fig_m.add_trace(trace, row=1, col=2, secondary_y=True)
+        n_traces = len(x_fig.data)
+        fig_m.add_traces(
+            x_fig.data,
+            rows=[1] * n_traces,
+            cols=[2] * n_traces,
+            secondary_ys=[True] * n_traces,
+        )
 
         # Update the XIC layout
         fig_m.update_layout(x_fig.layout)
 
-        # Make the y-axis of fig_xic independent
-        fig_m.update_yaxes(overwrite=True, row=1, col=2, secondary_y=True)
-
-        # Manually adjust the domain of secondary y-axis to only span the first row of the subplot
-        fig_m["layout"]["yaxis3"]["domain"] = [0.5, 1.0]
-
         # Add the XIM plot to the second row
         for trace in y_fig.data:
             trace.showlegend = False
             trace.legendgroup = trace.name
-            fig_m.add_trace(trace, row=2, col=1)
+        n_traces = len(y_fig.data)
+        fig_m.add_traces(y_fig.data, rows=[2] * n_traces, cols=[1] * n_traces)
 
         # Update the XIM layout
         fig_m.update_layout(y_fig.layout)
 
-        # Make the x-axis of fig_xim independent
-        fig_m.update_xaxes(overwrite=True, row=2, col=1)
-
-        # Reverse the x-axis range for the XIM subplot
-        fig_m.update_xaxes(autorange="reversed", row=2, col=1)
-
-        # Update xaxis properties
-        fig_m.update_xaxes(title_text=self.xlabel, row=2, col=2)
-        fig_m.update_xaxes(title_text=self.zlabel, row=2, col=1)
-
-        # Update yaxis properties
-        fig_m.update_yaxes(title_text=self.zlabel, row=1, col=2)
-        fig_m.update_yaxes(title_text=self.ylabel, row=2, col=1)
-
-        # Remove axes for first quadrant
-        fig_m.update_xaxes(visible=False, row=1, col=1)
-        fig_m.update_yaxes(visible=False, row=1, col=1)
-
-        # Update the layout
-        fig_m.update_layout(height=self.height, width=self.width, title=self.title)
-
+        # Collect the remaining axis settings so the layout is only validated once.
+        # Axes: (1, 1) xaxis/yaxis, (1, 2) xaxis2/yaxis2 with secondary yaxis3,
+        # (2, 1) xaxis3/yaxis4 and (2, 2) xaxis4/yaxis5
+        layout_updates = dict(
+            height=self.height,
+            width=self.width,
+            title=self.title,
+            # Remove axes for first quadrant
+            xaxis_visible=False,
+            yaxis_visible=False,
+            # Manually adjust the domain of secondary y-axis to only span the first row of the subplot
+            yaxis3_domain=[0.5, 1.0],
+            yaxis2_title_text=self.zlabel,
+            yaxis3_title_text=self.zlabel,
+            # Reverse the x-axis range for the XIM subplot
+            xaxis3_autorange="reversed",
+            xaxis3_title_text=self.zlabel,
+            yaxis4_title_text=self.ylabel,
+            xaxis4_title_text=self.xlabel,
+        )
         # change subplot axes font size
+        for axis in fig_m.select_xaxes():
+            layout_updates[f"{axis.plotly_name}_title_font_size"] = (
+                self.xaxis_label_font_size
+            )
+            layout_updates[f"{axis.plotly_name}_tickfont_size"] = (
+                self.xaxis_tick_font_size
+            )
+        for axis in fig_m.select_yaxes():
+            layout_updates[f"{axis.plotly_name}_title_font_size"] = (
+                self.yaxis_label_font_size
+            )
+            layout_updates[f"{axis.plotly_name}_tickfont_size"] = (
+                self.yaxis_tick_font_size
+            )
+        fig_m.update_layout(layout_updates)
         # each plot title is treated as an annotation
-        fig_m.for_each_annotation(
-            lambda annotation: annotation.update(font=dict(size=self.title_font_size))
-        )
-        fig_m.for_each_xaxis(
-            lambda axis: axis.title.update(font=dict(size=self.xaxis_label_font_size))
-        )
-        fig_m.for_each_yaxis(
-            lambda axis: axis.title.update(font=dict(size=self.yaxis_label_font_size))
-        )
-        fig_m.for_each_xaxis(
-            lambda axis: axis.tickfont.update(size=self.xaxis_tick_font_size)
-        )
-        fig_m.for_each_yaxis(
-            lambda axis: axis.tickfont.update(size=self.yaxis_tick_font_size)
-        )
+        fig_m.update_annotations(font_size=self.title_font_size)
 
         # Overwrite the figure with the new grid figure
         self.fig = fig_m
@@ -777,20 +982,20 @@ class PLOTLYPeakMapPlot(PLOTLY_MSPlot, PeakMapPlot):
         color_gen = ColorGenerator(
             colormap=self.feature_config.colormap, n=annotation_data.shape[0]
         )
-        for idx, (_, feature) in enumerate(annotation_data.iterrows()):
-            x0 = feature["leftWidth"]
-            x1 = feature["rightWidth"]
-            y0 = feature["IM_leftWidth"]
-            y1 = feature["IM_rightWidth"]
+        for idx, feature in enumerate(annotation_data.itertuples(index=False)):
+            x0 = feature.leftWidth
+            x1 = feature.rightWidth
+            y0 = feature.IM_leftWidth
+            y1 = feature.IM_rightWidth
 
             color = next(color_gen)
 
             if "name" in annotation_data.columns:
-                use_name = feature["name"]
+                use_name = feature.name
             else:
                 use_name = f"Feature {idx}"
             if "q_value" in annotation_data.columns:
-                legend_label = f"{use_name} (q-value: {feature['q_value']:.4f})"
+                legend_label = f"{use_name} (q-value: {feature.q_value:.4f})"
             else:
                 legend_label = f"{use_name}"
             self.fig.add_trace(
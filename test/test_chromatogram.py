@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def long_chromatogram():
+    rt = np.linspace(0, 100, 2000)
+    return pd.DataFrame({"rt": rt, "int": np.exp(-((rt - 50) ** 2) / 20)})
+
+
+@pytest.mark.parametrize(
+    "render_mode, trace_type",
+    [(None, "scattergl"), ("svg", "scatter"), ("webgl", "scattergl")],
+)
+def test_chromatogram_render_mode(long_chromatogram, render_mode, trace_type):
+    fig = long_chromatogram.plot(
+        x="rt",
+        y="int",
+        kind="chromatogram",
+        backend="ms_plotly",
+        render_mode=render_mode,
+        show_plot=False,
+    )
+    assert fig.data[0].type == trace_type
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def peakmap_with_nan_intensity():
+    return pd.DataFrame(
+        {
+            "RT": [1.0, 2.0, 3.0, 4.0],
+            "mz": [100.0, 200.0, 300.0, 400.0],
+            "inty": [10.0, np.nan, 30.0, 40.0],
+        }
+    )
+
+
+@pytest.mark.parametrize("backend", ["ms_bokeh", "ms_plotly"])
+def test_peakmap_nan_intensity(peakmap_with_nan_intensity, backend):
+    # A missing intensity must not break the intensity coloring of unbinned peaks
+    peakmap_with_nan_intensity.plot(
+        x="RT",
+        y="mz",
+        z="inty",
+        kind="peakmap",
+        backend=backend,
+        bin_peaks=False,
+        show_plot=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "render_mode, trace_type", [(None, "scattergl"), ("svg", "scatter")]
+)
+def test_peakmap_render_mode(peakmap_with_nan_intensity, render_mode, trace_type):
+    fig = peakmap_with_nan_intensity.plot(
+        x="RT",
+        y="mz",
+        z="inty",
+        kind="peakmap",
+        backend="ms_plotly",
+        bin_peaks=False,
+        render_mode=render_mode,
+        show_plot=False,
+    )
+    assert fig.data[0].type == trace_type